@@ -17,6 +17,8 @@
 import configparser
 import json
 import os
+import re
+import time
 from functools import cache
 from typing import TYPE_CHECKING, Any, Optional, TypeVar, Union, overload
 
@@ -27,16 +29,45 @@ _T = TypeVar('_T')
 _U = TypeVar('_U')
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable
 
     from sqlalchemy.orm import Session
 
 
+# Values already converted by config_get, keyed by (section, option, convert_type_fnc).
+# Each entry holds the time it was stored, the config instance it was read from and the value.
+_converted_cache: "dict[tuple[str, str, Optional[Callable[[str], Any]]], tuple[float, Any, Any]]" = {}
+
+
+_MISSING = object()
+
+# rucio.core.config.get, imported on the first lookup in the config table
+_core_config_get: "Optional[Callable[..., Any]]" = None
+
+# Parsed RSE credential files, keyed by path, with the st_mtime_ns of the file they were read from
+_credentials_cache: dict[str, tuple[int, dict[str, Any]]] = {}
+
+_LIST_SEPARATOR = re.compile(' *, *')
+
+_TRUE_STRINGS = frozenset(('true', 'yes', 'on'))
+_FALSE_STRINGS = frozenset(('false', 'no', 'off'))
+_BOOLEAN_TRUE_STRINGS = _TRUE_STRINGS | {'1'}
+_BOOLEAN_FALSE_STRINGS = _FALSE_STRINGS | {'0'}
+
+
+def _identity(value: str) -> str:
+    """Conversion function of the values looked up in the config table without convert_type_fnc."""
+    return value
+
+
 def convert_to_any_type(value: str) -> Union[bool, int, float, str]:
-    if value.lower() in ['true', 'yes', 'on']:
-        return True
-    elif value.lower() in ['false', 'no', 'off']:
-        return False
+    # Values starting like a number cannot be booleans, no need to lowercase them
+    if value[:1] not in '-+0123456789.':
+        lowered = value.lower()
+        if lowered in _TRUE_STRINGS:
+            return True
+        elif lowered in _FALSE_STRINGS:
+            return False
 
     for conv in (int, float):
         try:
@@ -50,35 +81,40 @@ def convert_to_any_type(value: str) -> Union[bool, int, float, str]:
 def _convert_to_boolean(value: Union[str, bool]) -> bool:
     if isinstance(value, bool):
         return value
-    if value.lower() in ['true', 'yes', 'on', '1']:
+    lowered = value if value.islower() else value.lower()
+    if lowered in _BOOLEAN_TRUE_STRINGS:
         return True
-    elif value.lower() in ['false', 'no', 'off', '0']:
+    elif lowered in _BOOLEAN_FALSE_STRINGS:
         return False
     raise ValueError('Not a boolean: %s' % value)
 
 
+@cache
 def is_client() -> bool:
     """"
-    Checks if the function is called from a client or from a server/daemon
+    Checks if the function is called from a client or from a server/daemon.
+    The RUCIO_CLIENT_MODE environment variable, parsed as a boolean, takes precedence over the configuration.
+    The result is cached until clean_cached_config is called.
 
     :returns client_mode: True if is called from a client, False if it is called from a server/daemon
     """
-    if 'RUCIO_CLIENT_MODE' not in os.environ:
+    env_client_mode = os.environ.get('RUCIO_CLIENT_MODE')
+    if env_client_mode is not None:
         try:
-            if config_has_section('database'):
-                client_mode = False
-            elif config_has_section('client'):
-                client_mode = True
-            else:
-                client_mode = False
-        except (RuntimeError, ConfigNotFound):
-            # If no configuration file is found the default value should be True
-            client_mode = True
-    else:
-        if os.environ['RUCIO_CLIENT_MODE']:
+            return _convert_to_boolean(env_client_mode)
+        except ValueError:
+            return bool(env_client_mode)
+
+    try:
+        if config_has_section('database'):
+            client_mode = False
+        elif config_has_section('client'):
             client_mode = True
         else:
             client_mode = False
+    except (RuntimeError, ConfigNotFound):
+        # If no configuration file is found the default value should be True
+        client_mode = True
 
     return client_mode
 
@@ -186,7 +222,7 @@ def config_get(
         session: "Optional[Session]" = None,
         use_cache: bool = True,
         expiration_time: int = 900,
-        convert_type_fnc: 'Callable[[str], _T]' = lambda x: x,
+        convert_type_fnc: Optional['Callable[[str], _T]'] = None,
 ) -> Union[_T, _U]:
     """
     Return the string value for a given option in a section
@@ -206,7 +242,8 @@ def config_get(
                       from server/daemon
     :param expiration_time: Time after that the cached value gets ignored. Only used if not found in config file and if
                             it is called from server/daemon
-    :param convert_type_fnc: A function used to parse the string config value into the desired destination type
+    :param convert_type_fnc: A function used to parse the string config value into the desired destination type.
+                             If not set, the string value is returned.
 
     :returns: the configuration value.
 
@@ -214,13 +251,20 @@ def config_get(
     :raises NoSectionError
     :raises RuntimeError
     """
+    cache_key = (section, option, convert_type_fnc)
+    use_converted_cache = use_cache and session is None
     try:
-        return convert_type_fnc(get_config().get(section, option))
+        config = get_config()
+        if use_converted_cache:
+            cached = _converted_cache.get(cache_key)
+            if cached is not None and cached[1] is config and time.monotonic() - cached[0] < expiration_time:
+                return cached[2]
+        value: Any = config.get(section, option)
+        if convert_type_fnc is not None:
+            value = convert_type_fnc(value)
     except (configparser.NoOptionError, configparser.NoSectionError, ConfigNotFound) as err:
 
-        client_mode = is_client()
-
-        if not client_mode and check_config_table:
+        if check_config_table and not is_client():
             try:
                 return __config_get_table(section=section, option=option, raise_exception=raise_exception,
                                           default=default, clean_cached=clean_cached, session=session,
@@ -235,6 +279,24 @@ def config_get(
                 clean_cached_config()
             return default
 
+    if use_converted_cache:
+        _converted_cache[cache_key] = (time.monotonic(), config, value)
+    return value
+
+
+def _config_get_from_file(section: str, option: str, convert_type_fnc: 'Callable[[str], _T]') -> Union[_T, object]:
+    """
+    Fast path of the typed getters: look the option up directly in the configuration snapshot.
+
+    :returns: the converted value, or _MISSING if the option is not in the configuration file,
+              in which case the lookup has to go through config_get.
+    """
+    try:
+        value = get_config()._flat[(section, option.lower())]
+    except (ConfigNotFound, KeyError):
+        return _MISSING
+    return convert_type_fnc(value)
+
 
 def config_has_section(section: str) -> bool:
     """
@@ -264,6 +326,7 @@ def config_add_section(section: str):
     :param section: Name of section in the Rucio config to add.
     :returns: None
     """
+    is_client.cache_clear()
     return get_config().add_section(section)
 
 
@@ -340,6 +403,10 @@ def config_get_int(
     :raises RuntimeError
     :raises ValueError
     """
+    if session is None:
+        value = _config_get_from_file(section, option, int)
+        if value is not _MISSING:
+            return value
     return config_get(
         section,
         option,
@@ -427,6 +494,10 @@ def config_get_float(
     :raises RuntimeError
     :raises ValueError
     """
+    if session is None:
+        value = _config_get_from_file(section, option, float)
+        if value is not _MISSING:
+            return value
     return config_get(
         section,
         option,
@@ -514,6 +585,10 @@ def config_get_bool(
     :raises RuntimeError
     :raises ValueError
     """
+    if session is None:
+        value = _config_get_from_file(section, option, _convert_to_boolean)
+        if value is not _MISSING:
+            return value
     return config_get(
         section,
         option,
@@ -625,7 +700,7 @@ def __convert_string_to_list(string: str) -> list[str]:
     """
     if not string or not string.strip():
         return []
-    return [item.strip(' ') for item in string.split(',')]
+    return _LIST_SEPARATOR.split(string.strip(' '))
 
 
 def __config_get_table(
@@ -656,10 +731,14 @@ def __config_get_table(
     :raises ConfigNotFound
     :raises DatabaseException
     """
+    global _core_config_get
+
     try:
-        from rucio.core.config import get as core_config_get
-        return core_config_get(section, option, default=default, session=session, use_cache=use_cache,
-                               expiration_time=expiration_time, convert_type_fnc=convert_type_fnc)
+        if _core_config_get is None:
+            from rucio.core.config import get as core_config_get
+            _core_config_get = core_config_get
+        return _core_config_get(section, option, default=default, session=session, use_cache=use_cache,
+                                expiration_time=expiration_time, convert_type_fnc=convert_type_fnc or _identity)
     except (ConfigNotFound, DatabaseException, ImportError) as err:
         if raise_exception and default is None:
             raise err
@@ -678,6 +757,27 @@ def config_get_items(section: str) -> list[tuple[str, str]]:
     return get_config().items(section)
 
 
+def config_get_many(
+        section: str,
+        options: "Iterable[str]",
+        defaults: Optional[dict[str, Any]] = None,
+) -> dict[str, Any]:
+    """
+    Return the string values of several options of a section from the configuration file in one pass.
+
+    Unlike config_get, the config table is not checked and no exception is raised for missing options.
+
+    :param section: the named section.
+    :param options: the named options.
+    :param defaults: the default values of the options, by option name. Options without a default are None if not found.
+
+    :returns: a dictionary with the value of each requested option.
+    """
+    values = get_config()._sections.get(section, {})
+    defaults = defaults or {}
+    return {option: values.get(option.lower(), defaults.get(option)) for option in options}
+
+
 def config_remove_option(section: str, option: str) -> bool:
     """
     Remove the specified option from a given section.
@@ -688,6 +788,7 @@ def config_remove_option(section: str, option: str) -> bool:
 
     :raises NoSectionError: If the section does not exist.
     """
+    _converted_cache.clear()
     return get_config().remove_option(section, option)
 
 
@@ -701,9 +802,11 @@ def config_set(section: str, option: str, value: str) -> None:
 
     :raises NoSectionError: If the section does not exist.
     """
+    _converted_cache.clear()
     return get_config().set(section, option, value)
 
 
+@cache
 def get_config_dirs() -> list[str]:
     """
     Returns all available configuration directories in order:
@@ -711,6 +814,8 @@ def get_config_dirs() -> list[str]:
     - $VIRTUAL_ENV/etc/
     - $CONDA_PREFIX/etc
     - /opt/rucio/
+
+    The result is cached until clean_cached_config is called.
     """
     configdirs = []
 
@@ -744,39 +849,97 @@ def get_rse_credentials(path_to_credentials_file: Optional[Union[str, os.PathLik
             if os.path.exists(p):
                 path = p
     try:
+        path = os.fspath(path)
+        mtime = os.stat(path).st_mtime_ns
+        cached = _credentials_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
         # Load all user credentials
         with open(path) as cred_file:
             credentials = json.load(cred_file)
     except Exception as error:
         raise exception.ErrorLoadingCredentials(error)
+    _credentials_cache[path] = (mtime, credentials)
     return credentials
 
 
-@cache
-def get_config() -> configparser.ConfigParser:
-    """Factory function for the configuration class. Returns the ConfigParser instance."""
-    return Config().parser
+# Seconds between two checks of the modification time of the cached configuration file
+CONFIG_MTIME_CHECK_INTERVAL = 10
+
+_config: "Optional[Config]" = None
+_config_mtime: Optional[int] = None
+_config_checked_at = 0.0
+
+
+def get_config() -> "Config":
+    """
+    Factory function for the configuration class. Returns the Config instance.
+
+    The instance is cached. At most once every CONFIG_MTIME_CHECK_INTERVAL seconds, the modification
+    time of the configuration file is checked and the file is read again if it has changed.
+    """
+    global _config, _config_mtime, _config_checked_at
+
+    now = time.monotonic()
+    if _config is not None:
+        if now - _config_checked_at < CONFIG_MTIME_CHECK_INTERVAL:
+            return _config
+        _config_checked_at = now
+        try:
+            if os.stat(_config.configfile).st_mtime_ns == _config_mtime:
+                return _config
+        except OSError:
+            # Keep the configuration already loaded if the file became unreadable
+            return _config
+        is_client.cache_clear()
+
+    config = Config()
+    try:
+        _config_mtime = os.stat(config.configfile).st_mtime_ns
+    except OSError:
+        _config_mtime = None
+    _config, _config_checked_at = config, now
+    return config
 
 
 def clean_cached_config() -> None:
-    """Deletes the cached config singleton instance."""
-    get_config.cache_clear()
+    """Deletes the cached config singleton instance and the values converted from it."""
+    global _config
+
+    _config = None
+    get_config_dirs.cache_clear()
+    is_client.cache_clear()
+    _converted_cache.clear()
+    _credentials_cache.clear()
 
 
 class Config:
     """
     The configuration class reading the config file on init, located by using
     get_config_dirs or the use of the RUCIO_CONFIG environment variable.
+
+    The parsed values are kept in plain dictionaries, so lookups do not go through
+    the ConfigParser machinery. The parser is only used to modify the configuration.
     """
+
+    __slots__ = ('parser', 'configfile', '_sections', '_items', '_flat', '_uninterpolated')
+
     def __init__(self):
         self.parser = configparser.ConfigParser()
 
         if 'RUCIO_CONFIG' in os.environ:
             self.configfile = os.environ['RUCIO_CONFIG']
         else:
-            configs = [os.path.join(confdir, 'rucio.cfg') for confdir in get_config_dirs()]
-            self.configfile = next(iter(filter(os.path.exists, configs)), None)
-            if self.configfile is None:
+            for confdir in get_config_dirs():
+                configfile = os.path.join(confdir, 'rucio.cfg')
+                try:
+                    os.stat(configfile)
+                except OSError:
+                    continue
+                self.configfile = configfile
+                break
+            else:
+                configs = [os.path.join(confdir, 'rucio.cfg') for confdir in get_config_dirs()]
                 raise ConfigNotFound(
                     'Could not load Rucio configuration file. '
                     'Rucio looked in the following paths for a configuration file, in order:'
@@ -784,3 +947,101 @@ class Config:
 
         if not self.parser.read(self.configfile) == [self.configfile]:
             raise ConfigLoadingError(self.configfile)
+
+        self._load_snapshot()
+
+    def _load_snapshot(self) -> None:
+        """Flattens the parsed configuration into the dictionaries used for lookups."""
+        # Options of each section in the order of parser.options, with their values
+        self._sections: dict[str, dict[str, str]] = {}
+        # (name, value) pairs of each section in the order of parser.items, which lists the DEFAULT options first
+        self._items: dict[str, list[tuple[str, str]]] = {}
+        self._flat: dict[tuple[str, str], str] = {}
+        # Sections with options which could not be interpolated and are left to the parser
+        self._uninterpolated: set[str] = set()
+        # The DEFAULT options can be looked up on their own, but DEFAULT is not listed as a section
+        default_section = self.parser.default_section
+        for option, value in self.parser.items(default_section, raw=True):
+            if '%' in value:
+                try:
+                    value = self.parser.get(default_section, option)
+                except configparser.InterpolationError:
+                    self._uninterpolated.add(default_section)
+                    continue
+            self._flat[(default_section, option)] = value
+        for section in self.parser.sections():
+            items = self._items[section] = []
+            for option, value in self.parser.items(section, raw=True):
+                # Only values containing '%' go through the interpolation of the parser
+                if '%' in value:
+                    try:
+                        value = self.parser.get(section, option)
+                    except configparser.InterpolationError:
+                        # Left to the parser, which raises the error on lookup
+                        self._uninterpolated.add(section)
+                        continue
+                items.append((option, value))
+                self._flat[(section, option)] = value
+            self._sections[section] = {
+                option: self._flat[(section, option)] for option in self.parser.options(section) if (section, option) in self._flat
+            }
+
+    def get(self, section: str, option: str) -> str:
+        """
+        Return the value for a given option in a section.
+
+        :raises NoOptionError: If the option does not exist.
+        :raises NoSectionError: If the section does not exist.
+        """
+        try:
+            return self._flat[(section, option.lower())]
+        except KeyError:
+            if section in self._uninterpolated:
+                return self.parser.get(section, option)
+            if section in self._sections or section == self.parser.default_section:
+                raise configparser.NoOptionError(option, section) from None
+            raise configparser.NoSectionError(section) from None
+
+    def has_section(self, section: str) -> bool:
+        """Indicates whether the named section is present in the configuration."""
+        return section in self._sections
+
+    def has_option(self, section: str, option: str) -> bool:
+        """Indicates whether the named option is present in the given section."""
+        if (section, option.lower()) in self._flat:
+            return True
+        return section in self._uninterpolated and self.parser.has_option(section, option)
+
+    def options(self, section: str) -> list[str]:
+        """Return all options from a given section. Throws NoSectionError if the section does not exist."""
+        if section in self._uninterpolated:
+            return self.parser.options(section)
+        try:
+            return list(self._sections[section])
+        except KeyError:
+            raise configparser.NoSectionError(section) from None
+
+    def items(self, section: str) -> list[tuple[str, str]]:
+        """Return all (name, value) pairs from a given section. Throws NoSectionError if the section does not exist."""
+        if section in self._uninterpolated:
+            return self.parser.items(section)
+        try:
+            return list(self._items[section])
+        except KeyError:
+            raise configparser.NoSectionError(section) from None
+
+    def add_section(self, section: str) -> None:
+        """Add a new section. Throws DuplicateSectionError if it already exists."""
+        self.parser.add_section(section)
+        self._load_snapshot()
+
+    def set(self, section: str, option: str, value: str) -> None:
+        """Set an option in a given section. Throws NoSectionError if the section does not exist."""
+        self.parser.set(section, option, value)
+        self._load_snapshot()
+
+    def remove_option(self, section: str, option: str) -> bool:
+        """Remove an option from a given section. Throws NoSectionError if the section does not exist."""
+        existed = self.parser.remove_option(section, option)
+        self._load_snapshot()
+        return existed
@@ -257,26 +257,36 @@ def date_to_str(date: datetime.datetime) -> Optional[str]:
     return datetime.datetime.strftime(date, DATE_FORMAT) if date else None
 
 
+def api_encoder_default(obj: Any) -> Any:
+    """ Convert the special values which are not natively JSON serializable.
+    Shared by APIEncoder and the serializers which accept a default callback.
+
+    :param obj: the value to convert.
+    :raises TypeError: if the value is not supported.
+    """
+    if isinstance(obj, datetime.datetime):
+        # convert any datetime to RFC 1123 format
+        return date_to_str(obj)
+    elif isinstance(obj, (datetime.time, datetime.date)):
+        # should not happen since the only supported date-like format
+        # supported at dmain schema level is 'datetime' .
+        return obj.isoformat()
+    elif isinstance(obj, datetime.timedelta):
+        return obj.days * 24 * 60 * 60 + obj.seconds
+    elif isinstance(obj, Enum):
+        return obj.name
+    elif isinstance(obj, (InternalAccount, InternalScope)):
+        return obj.external
+    raise TypeError(f'Object of type {obj.__class__.__name__} is not JSON serializable')
+
+
 class APIEncoder(json.JSONEncoder):
     """ Propretary JSONEconder subclass used by the json render function.
     This is needed to address the encoding of special values.
     """
 
     def default(self, obj):  # pylint: disable=E0202
-        if isinstance(obj, datetime.datetime):
-            # convert any datetime to RFC 1123 format
-            return date_to_str(obj)
-        elif isinstance(obj, (datetime.time, datetime.date)):
-            # should not happen since the only supported date-like format
-            # supported at dmain schema level is 'datetime' .
-            return obj.isoformat()
-        elif isinstance(obj, datetime.timedelta):
-            return obj.days * 24 * 60 * 60 + obj.seconds
-        elif isinstance(obj, Enum):
-            return obj.name
-        elif isinstance(obj, (InternalAccount, InternalScope)):
-            return obj.external
-        return json.JSONEncoder.default(self, obj)
+        return api_encoder_default(obj)
 
 
 def render_json(*args, **kwargs) -> str:
@@ -1232,6 +1242,10 @@ def run_cmd_process(cmd: str, timeout: int = 3600) -> tuple[int, str]:
     return returncode, stdout
 
 
+# (name, id) keys of the RSEs resolved by gateway_update_return_dict
+_RETURN_DICT_RSE_KEYS = tuple((rse_str, f'{rse_str}_id') for rse_str in ('rse', 'src_rse', 'source_rse', 'dest_rse', 'destination_rse'))
+
+
 def gateway_update_return_dict(
         dictionary: dict[str, Any],
         session: Optional["Session"] = None
@@ -1246,29 +1260,25 @@ def gateway_update_return_dict(
     if not isinstance(dictionary, dict):
         return dictionary
 
-    copied = False  # Avoid side effects from pass by object
-
-    for rse_str in ['rse', 'src_rse', 'source_rse', 'dest_rse', 'destination_rse']:
-        rse_id_str = '%s_id' % rse_str
-        if rse_id_str in dictionary.keys() and dictionary[rse_id_str] is not None:
-            if rse_str not in dictionary.keys():
-                if not copied:
-                    dictionary = dictionary.copy()
-                    copied = True
-                import rucio.core.rse
-                dictionary[rse_str] = rucio.core.rse.get_rse_name(rse_id=dictionary[rse_id_str], session=session)
-
-    if 'account' in dictionary.keys() and dictionary['account'] is not None:
-        if not copied:
-            dictionary = dictionary.copy()
-            copied = True
-        dictionary['account'] = dictionary['account'].external
-
-    if 'scope' in dictionary.keys() and dictionary['scope'] is not None:
-        if not copied:
-            dictionary = dictionary.copy()
-            copied = True
-        dictionary['scope'] = dictionary['scope'].external
+    # Only copy when a value has to change, to avoid side effects from pass by object
+    missing_rse_ids = [(rse_str, rse_id_str) for rse_str, rse_id_str in _RETURN_DICT_RSE_KEYS
+                       if rse_str not in dictionary and dictionary.get(rse_id_str) is not None]
+    account = dictionary.get('account')
+    scope = dictionary.get('scope')
+    if not missing_rse_ids and account is None and scope is None:
+        return dictionary
+
+    dictionary = dictionary.copy()
+    if missing_rse_ids:
+        import rucio.core.rse
+        for rse_str, rse_id_str in missing_rse_ids:
+            dictionary[rse_str] = rucio.core.rse.get_rse_name(rse_id=dictionary[rse_id_str], session=session)
+
+    if account is not None:
+        dictionary['account'] = account.external
+
+    if scope is not None:
+        dictionary['scope'] = scope.external
 
     return dictionary
 
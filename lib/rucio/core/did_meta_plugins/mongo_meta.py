@@ -13,12 +13,14 @@
 # limitations under the License.
 
 import operator
+from configparser import NoSectionError
+from functools import cache
 from typing import TYPE_CHECKING
 
 import pymongo
 
 from rucio.common import config, exception
-from rucio.common.types import InternalScope
+from rucio.common.utils import chunks
 from rucio.core.did_meta_plugins.did_meta_plugin_interface import DidMetaPlugin
 from rucio.core.did_meta_plugins.filter_engine import FilterEngine
 
@@ -33,6 +35,26 @@ IMMUTABLE_KEYS = [
     'name',  # generated on insert
     'vo'  # generated on insert
 ]
+IMMUTABLE_KEYS_PROJECTION = {key: 0 for key in IMMUTABLE_KEYS}
+
+# Compound index backing list_dids: the equality filters (scope, vo) first, then the name for the projection
+LIST_DIDS_INDEX_NAME = 'scope_vo_name'
+LIST_DIDS_INDEX_KEYS = [('scope', pymongo.ASCENDING), ('vo', pymongo.ASCENDING), ('name', pymongo.ASCENDING)]
+# Number of documents fetched per round-trip by list_dids when no limit is given
+LIST_DIDS_BATCH_SIZE = 1000
+# Server-side time limit of a list_dids query, in milliseconds
+LIST_DIDS_MAX_TIME_MS = 30_000
+
+
+@cache
+def _get_client(uri: str) -> pymongo.MongoClient:
+    """
+    Return the client connected to the given URI, shared by all the plugin instances as it holds the connection pool.
+
+    :param uri: The MongoDB connection URI
+    :returns: The MongoClient instance
+    """
+    return pymongo.MongoClient(uri)
 
 
 class MongoDidMeta(DidMetaPlugin):
@@ -55,36 +77,60 @@ class MongoDidMeta(DidMetaPlugin):
             'mongo_collection': collection,
         }
 
+        # Read the whole section at once instead of querying the configuration per parameter.
+        try:
+            metadata_config = dict(config.config_get_items('metadata'))
+        except NoSectionError:
+            metadata_config = {}
+
         for param in con_params:
             if con_params[param] is None:
-                if config.config_has_option('metadata', param):
-                    con_params[param] = (
-                        config.config_get_int('metadata', param)
-                        if param == 'mongo_service_port'
-                        else config.config_get('metadata', param)
-                    )
-                else:
+                if param not in metadata_config:
                     raise exception.ConnectionParameterNotFound(param)
+                con_params[param] = metadata_config[param]
+        con_params['mongo_service_port'] = int(con_params['mongo_service_port'])
 
-        if user is None and config.config_has_option('metadata', 'mongo_user'):
-            user = config.config_get('metadata', 'mongo_user', default=None)
+        if user is None:
+            user = metadata_config.get('mongo_user')
 
-        if password is None and config.config_has_option('metadata', 'mongo_password'):
-            password = config.config_get('metadata', 'mongo_password')
+        if password is None:
+            password = metadata_config.get('mongo_password')
 
         # Set the auth (fallback to an anonymous connection if either user or password is not defined).
         auth = "" if not user or not password else f"{user}:{password}@"
 
-        self.client = pymongo.MongoClient(
+        self.client = _get_client(
             f"mongodb://{auth}{con_params['mongo_service_host']}:{con_params['mongo_service_port']}/"
         )
         self.db = self.client[con_params['mongo_db']]
         self.col = self.db[con_params['mongo_collection']]
+        # created on first use, so that instantiating the plugin does not need a reachable server
+        self._list_dids_index_created = False
 
         self.plugin_name = "MONGO"
 
     def drop_database(self):
         self.client.drop_database(self.db.name)
+        self._list_dids_index_created = False
+
+    def _create_list_dids_index(self):
+        """
+        Create the compound index used by list_dids, if not already done by this instance.
+        """
+        if not self._list_dids_index_created:
+            self.col.create_index(LIST_DIDS_INDEX_KEYS, name=LIST_DIDS_INDEX_NAME)
+            self._list_dids_index_created = True
+
+    @staticmethod
+    def _make_id(scope, name):
+        """
+        Build the _id of the document holding the metadata of a DID.
+
+        :param scope: The scope of the DID
+        :param name: The name of the DID
+        :returns: The document _id
+        """
+        return f"{scope.internal}:{name}"
 
     def get_metadata(self, scope, name, *, session: "Optional[Session]" = None):
         """
@@ -95,20 +141,33 @@ class MongoDidMeta(DidMetaPlugin):
         :param session: The database session in use
         :returns: The metadata for the DID
         """
-        # get first document with this DID == _id
+        # get first document with this DID == _id, without the immutable keys
         doc = self.col.find_one({
-            "_id": "{}:{}".format(scope.internal, name)
-        })
-
-        # pop immutable keys
-        for key in IMMUTABLE_KEYS:
-            if key in doc:
-                doc.pop(key)
+            "_id": self._make_id(scope, name)
+        }, projection=IMMUTABLE_KEYS_PROJECTION)
 
         if not doc:
             raise exception.DataIdentifierNotFound(f"No metadata found for did '{scope}:{name}'")
         return doc
 
+    def get_metadata_bulk(self, dids, *, session: "Optional[Session]" = None):
+        """
+        Get the metadata of several data identifiers, with one query per chunk of DIDs instead of one per DID.
+
+        :param dids: A list of dictionaries with the scope and name of the DIDs
+        :param session: The database session in use
+        :returns: A dictionary of the metadata of the DIDs found, keyed by (scope, name)
+        """
+        make_id = self._make_id
+        dids_by_id = {make_id(did['scope'], did['name']): (did['scope'], did['name']) for did in dids}
+
+        metadata = {}
+        for chunk in chunks(list(dids_by_id), 1000):
+            # _id is needed to match the documents to the DIDs, the other immutable keys are excluded
+            for doc in self.col.find({"_id": {"$in": chunk}}, projection={**IMMUTABLE_KEYS_PROJECTION, '_id': 1}):
+                metadata[dids_by_id[doc.pop('_id')]] = doc
+        return metadata
+
     def set_metadata(self, scope, name, key, value, recursive=False, *, session: "Optional[Session]" = None):
         """
         Set single metadata key.
@@ -132,25 +191,50 @@ class MongoDidMeta(DidMetaPlugin):
         :param recursive: recurse into DIDs (not supported)
         :param session: The database session in use
         """
+        # set first document with DID == _id
+        self.col.update_one(*self._metadata_update(scope, name, metadata), upsert=True)
+
+    def set_metadata_many(self, dids_metadata, *, session: "Optional[Session]" = None):
+        """
+        Bulk set metadata keys of several DIDs in a single round-trip.
+
+        :param dids_metadata: list of (scope, name, metadata) tuples, metadata being a dictionary of keypairs to be added
+        :param session: The database session in use
+        """
+        operations = [
+            pymongo.UpdateOne(*self._metadata_update(scope, name, metadata), upsert=True)
+            for scope, name, metadata in dids_metadata
+        ]
+        if operations:
+            self.col.bulk_write(operations, ordered=False)
+
+    @staticmethod
+    def _metadata_update(scope, name, metadata):
+        """
+        Build the filter and the update document upserting the metadata of a DID.
+
+        :param scope: the scope of DID
+        :param name: the name of the DID
+        :param metadata: dictionary of metadata keypairs to be added, the immutable keys are removed from it
+        :returns: a (filter, update) tuple
+        """
         # pop immutable keys
         for key in IMMUTABLE_KEYS:
             if key in metadata:
                 metadata.pop(key)
 
-        # set first document with DID == _id
-        self.col.update_one(
+        return (
             {
-                "_id": "{}:{}".format(scope.internal, name)
+                "_id": MongoDidMeta._make_id(scope, name)
             },
             {
                 '$set': metadata,
                 '$setOnInsert': {
-                    'scope': "{}".format(scope.external),
-                    'vo': "{}".format(scope.vo),
-                    'name': "{}".format(name)
+                    'scope': f"{scope.external}",
+                    'vo': f"{scope.vo}",
+                    'name': f"{name}"
                 }
-            },
-            upsert=True
+            }
         )
 
     def delete_metadata(self, scope, name, key, *, session: "Optional[Session]" = None):
@@ -161,14 +245,27 @@ class MongoDidMeta(DidMetaPlugin):
         :param name: the name of the DID
         :param key: the key to be deleted
         """
-        meta = {key: ""}
+        self.delete_metadata_bulk(scope, name, [key], session=session)
+
+    def delete_metadata_bulk(self, scope, name, keys, *, session: "Optional[Session]" = None):
+        """
+        Delete several keys from metadata in a single update.
+
+        :param scope: the scope of DID
+        :param name: the name of the DID
+        :param keys: the keys to be deleted
+        """
+        meta = {key: "" for key in keys}
+        if not meta:
+            return
         try:
-            self.col.update_one({"_id": "{}:{}".format(scope.internal, name)}, {'$unset': meta})
+            self.col.update_one({"_id": self._make_id(scope, name)}, {'$unset': meta})
         except Exception as e:
             raise exception.DataIdentifierNotFound(e)
 
     def list_dids(self, scope, filters, did_type='collection', ignore_case=False, limit=None,
-                  offset=None, long=False, recursive=False, ignore_dids=None, *, session: "Optional[Session]" = None):
+                  offset=None, long=False, recursive=False, ignore_dids=None, *, session: "Optional[Session]" = None,
+                  timeout_ms: "Optional[int]" = LIST_DIDS_MAX_TIME_MS):
         if not ignore_dids:
             ignore_dids = set()
 
@@ -185,37 +282,44 @@ class MongoDidMeta(DidMetaPlugin):
             ]
         )
 
+        if ignore_dids:
+            # exclude the DIDs to ignore server side
+            mongo_query_str['$nor'] = [
+                {'scope': did_scope, 'name': did_name}
+                for did_scope, did_name in (did.split(':', 1) for did in ignore_dids)
+            ]
+
         if recursive:
             # TODO: possible, but requires retrieving the results of a concurrent sqla query to call list_content on for datasets and containers
             raise exception.UnsupportedOperation(
-                "'{}' metadata module does not currently support recursive searches".format(
-                    self.plugin_name.lower()
-                ))
-
-        if long:
-            query_result = self.col.find(mongo_query_str)
-            if limit:
-                query_result = query_result.limit(limit)
-            for did in query_result:
-                did_full = "{}:{}".format(did['scope'], did['name'])
-                if did_full not in ignore_dids:  # aggregating recursive queries may contain duplicate DIDs
-                    ignore_dids.add(did_full)
-                    yield {
-                        'scope': InternalScope(did['scope']),
-                        'name': did['name'],
-                        'did_type': "N/A",
-                        'bytes': "N/A",
-                        'length': "N/A"
-                    }
-        else:
-            query_result = self.col.find(mongo_query_str)
-            if limit:
-                query_result = query_result.limit(limit)
-            for did in query_result:
-                did_full = "{}:{}".format(did['scope'], did['name'])
-                if did_full not in ignore_dids:  # aggregating recursive queries may contain duplicate DIDs
-                    ignore_dids.add(did_full)
-                    yield did['name']
+                f"'{self.plugin_name.lower()}' metadata module does not currently support recursive searches"
+            )
+
+        self._create_list_dids_index()
+
+        # every clause filters on equality of scope and vo, pin the plan to the index starting with them
+        query_result = self.col.find(mongo_query_str, projection={'scope': 1, 'name': 1, '_id': 0}).hint(LIST_DIDS_INDEX_NAME)
+        if limit:
+            query_result = query_result.limit(limit)
+        # bound the server time spent on a badly planned query, None disables the limit
+        if timeout_ms:
+            query_result = query_result.max_time_ms(timeout_ms)
+        # fetch the whole result in one batch if limited, avoid the small default first batch otherwise
+        query_result = query_result.batch_size(limit or LIST_DIDS_BATCH_SIZE)
+        for did in query_result:
+            # aggregating recursive queries may contain duplicate DIDs, record the ones already yielded
+            ignore_dids.add(f"{did['scope']}:{did['name']}")
+            if long:
+                # the query is restricted to the given scope, reuse it for all the DIDs
+                yield {
+                    'scope': scope,
+                    'name': did['name'],
+                    'did_type': "N/A",
+                    'bytes': "N/A",
+                    'length': "N/A"
+                }
+            else:
+                yield did['name']
 
     def manages_key(self, key, *, session: "Optional[Session]" = None):
         return True
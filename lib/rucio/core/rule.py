@@ -29,6 +29,7 @@ from sqlalchemy.exc import (
     NoResultFound,  # https://pydoc.dev/sqlalchemy/latest/sqlalchemy.exc.NoResultFound.html
     StatementError,
 )
+from sqlalchemy.orm import load_only
 from sqlalchemy.sql import func
 from sqlalchemy.sql.expression import and_, false, null, or_, true, tuple_
 
@@ -959,6 +960,7 @@ def inject_rule(
 @stream_session
 def list_rules(
     filters: Optional[dict[str, Any]] = None,
+    columns: Optional['Sequence[str]'] = None,
     *,
     session: "Session"
 ) -> 'Iterator[dict[str, Any]]':
@@ -966,6 +968,7 @@ def list_rules(
     List replication rules.
 
     :param filters: dictionary of attributes by which the results should be filtered.
+    :param columns: names of the rule columns to load. The id and the bytes of the DID are always returned. All columns if not set.
     :param session: The database session in use.
     :raises:        RucioException
     """
@@ -980,6 +983,8 @@ def list_rules(
             models.ReplicationRule.name == models.DataIdentifier.name
         )
     )
+    if columns:
+        stmt = stmt.options(load_only(*(getattr(models.ReplicationRule, column) for column in columns)))
     if filters is not None:
         for (key, value) in filters.items():
             if key in ['account', 'scope']:
@@ -17,7 +17,6 @@ from typing import TYPE_CHECKING, Any, Optional
 from rucio.common import exception
 from rucio.common.constants import DEFAULT_VO
 from rucio.common.types import InternalAccount, InternalScope
-from rucio.common.utils import gateway_update_return_dict
 from rucio.core import lifetime_exception
 from rucio.db.sqla.constants import DatabaseOperationType
 from rucio.db.sqla.session import db_session
@@ -46,7 +45,10 @@ def list_exceptions(
         exceptions = lifetime_exception.list_exceptions(exception_id=exception_id, states=states, session=session)
         for e in exceptions:
             if vo == e['scope'].vo:
-                yield gateway_update_return_dict(e, session=session)
+                # the core yields a new dictionary per exception, convert it in place instead of copying it
+                e['scope'] = e['scope'].external
+                e['account'] = e['account'].external
+                yield e
 
 
 def add_exception(
@@ -23,25 +23,22 @@ from rucio.core.rse import get_rse_id
 from rucio.db.sqla.session import read_session
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from sqlalchemy.orm import Session
 
     from rucio.core.permission import PermissionResult
 
 
-@read_session
-def has_permission(issuer: str, action: str, kwargs: dict[str, Any], vo: str = DEFAULT_VO, *, session: "Session") -> 'PermissionResult':
+def _internalize_kwargs(kwargs: dict[str, Any], vo: str, *, session: "Session") -> dict[str, Any]:
     """
-    Checks if an account has the specified permission to
-    execute an action with parameters.
+    Convert the external identifiers in the kwargs of a permission check to internal types.
 
-    :param issuer:  The Account issuer.
+    :param kwargs:  List of arguments for the action.
     :param vo:      The VO to check against.
-    :param action:  The action (API call) called by the account.
     :param session: The db session to use
-    :param kwargs:  List of arguments for the action.
-    :returns: True if account is allowed to call the API call, otherwise False
+    :returns: A converted copy of the kwargs
     """
-
     kwargs = deepcopy(kwargs)
     if 'rse' in kwargs and 'rse_id' not in kwargs:
         try:
@@ -69,7 +66,50 @@ def has_permission(issuer: str, action: str, kwargs: dict[str, Any], vo: str = D
             if 'rules' in d:
                 for r in d['rules']:
                     r['account'] = InternalAccount(r['account'], vo=vo)
+    return kwargs
+
+
+@read_session
+def has_permission(issuer: str, action: str, kwargs: dict[str, Any], vo: str = DEFAULT_VO, *, session: "Session") -> 'PermissionResult':
+    """
+    Checks if an account has the specified permission to
+    execute an action with parameters.
 
+    :param issuer:  The Account issuer.
+    :param vo:      The VO to check against.
+    :param action:  The action (API call) called by the account.
+    :param session: The db session to use
+    :param kwargs:  List of arguments for the action.
+    :returns: True if account is allowed to call the API call, otherwise False
+    """
+    kwargs = _internalize_kwargs(kwargs, vo, session=session)
     issuer_account = InternalAccount(issuer, vo=vo)
 
     return permission.has_permission(issuer=issuer_account, action=action, kwargs=kwargs, session=session)
+
+
+@read_session
+def has_permissions(issuer: str, actions: 'Sequence[str]', kwargs: dict[str, Any], vo: str = DEFAULT_VO, *, session: "Session") -> dict[str, 'PermissionResult']:
+    """
+    Checks if an account has the permission to execute several actions
+    with the same parameters. The parameters are converted only once and all
+    checks share the same session. The checks are done in order and stop at
+    the first denied action.
+
+    :param issuer:  The Account issuer.
+    :param vo:      The VO to check against.
+    :param actions: The actions (API calls) called by the account.
+    :param session: The db session to use
+    :param kwargs:  List of arguments for the actions.
+    :returns: Dictionary of the results of the checks done, by action
+    """
+    kwargs = _internalize_kwargs(kwargs, vo, session=session)
+    issuer_account = InternalAccount(issuer, vo=vo)
+
+    results = {}
+    for action in actions:
+        result = permission.has_permission(issuer=issuer_account, action=action, kwargs=kwargs, session=session)
+        results[action] = result
+        if not result.allowed:
+            break
+    return results
@@ -14,29 +14,74 @@
 
 from typing import TYPE_CHECKING, Any, Literal, Optional
 
-from rucio.common.config import config_get_bool
+from rucio.common.config import config_get_bool, get_config
 from rucio.common.constants import DEFAULT_VO
-from rucio.common.exception import AccessDenied
+from rucio.common.exception import AccessDenied, ConfigNotFound
 from rucio.common.schema import validate_schema
 from rucio.common.types import InternalAccount, InternalScope
 from rucio.common.utils import gateway_update_return_dict
 from rucio.core import rule
 from rucio.db.sqla.constants import DatabaseOperationType
 from rucio.db.sqla.session import db_session
-from rucio.gateway.permission import has_permission
+from rucio.gateway.permission import has_permission, has_permissions
 
 if TYPE_CHECKING:
     from collections.abc import Iterator, Sequence
 
     from sqlalchemy.orm import Session
 
+    from rucio.common.config import Config
+
+
+# The multi_vo setting, with the Config instance it was read with
+_MULTI_VO: "Optional[tuple[Optional[Config], bool]]" = None
+
 
 def is_multi_vo(session: "Session") -> bool:
     """
-    Check whether this instance is configured for multi-VO
+    Check whether this instance is configured for multi-VO. The setting is only read again once the
+    configuration is reloaded or cleaned, as a new Config instance is then in use.
     returns: Boolean True if running in multi-VO
     """
-    return config_get_bool('common', 'multi_vo', raise_exception=False, default=False, session=session)
+    global _MULTI_VO
+
+    try:
+        config = get_config()
+    except ConfigNotFound:
+        config = None
+    if _MULTI_VO is None or _MULTI_VO[0] is not config:
+        _MULTI_VO = (config, config_get_bool('common', 'multi_vo', raise_exception=False, default=False, session=session))
+    return _MULTI_VO[1]
+
+
+def _check_rule_permissions(
+    issuer: str,
+    vo: str,
+    action: str,
+    kwargs: dict[str, Any],
+    denied_message: str,
+    *,
+    session: "Session",
+) -> None:
+    """
+    Check in one go that the issuer can access rules of the VO (in multi-VO mode) and execute the action.
+
+    :param issuer:         The issuing account of this operation.
+    :param vo:             The VO to act on.
+    :param action:         The rule action to check.
+    :param kwargs:         The arguments of the action.
+    :param denied_message: Description of the action used in the AccessDenied message.
+    :param session:        The database session in use.
+    :raises:               AccessDenied
+    """
+    actions = ['access_rule_vo', action] if is_multi_vo(session=session) else [action]
+    auth_results = has_permissions(issuer=issuer, vo=vo, actions=actions, kwargs=kwargs, session=session)
+    auth_result = auth_results.get('access_rule_vo')
+    if auth_result is not None and not auth_result.allowed:
+        raise AccessDenied('Account %s can not access rules at other VOs. %s' % (issuer, auth_result.message))
+    auth_result = auth_results[action]
+    if not auth_result.allowed:
+        raise AccessDenied('Account %s can not %s. %s' % (issuer, denied_message, auth_result.message))
 
 
 def add_replication_rule(
@@ -99,12 +144,12 @@ def add_replication_rule(
     if activity is None:
         activity = 'User Subscriptions'
 
-    kwargs = {'dids': dids, 'copies': copies, 'rse_expression': rse_expression, 'weight': weight, 'lifetime': lifetime,
-              'grouping': grouping, 'account': account, 'locked': locked, 'subscription_id': subscription_id,
-              'source_replica_expression': source_replica_expression, 'notify': notify, 'activity': activity,
-              'purge_replicas': purge_replicas, 'ignore_availability': ignore_availability, 'comment': comment,
-              'ask_approval': ask_approval, 'asynchronous': asynchronous, 'delay_injection': delay_injection, 'priority': priority,
-              'split_container': split_container, 'meta': meta}
+    kwargs: dict[str, Any] = {'dids': dids, 'copies': copies, 'rse_expression': rse_expression, 'weight': weight, 'lifetime': lifetime,
+                              'grouping': grouping, 'account': account, 'locked': locked, 'subscription_id': subscription_id,
+                              'source_replica_expression': source_replica_expression, 'notify': notify, 'activity': activity,
+                              'purge_replicas': purge_replicas, 'ignore_availability': ignore_availability, 'comment': comment,
+                              'ask_approval': ask_approval, 'asynchronous': asynchronous, 'delay_injection': delay_injection, 'priority': priority,
+                              'split_container': split_container, 'meta': meta}
 
     validate_schema(name='rule', obj=kwargs, vo=vo)
 
@@ -113,31 +158,19 @@ def add_replication_rule(
         if not auth_result.allowed:
             raise AccessDenied('Account %s can not add replication rule. %s' % (issuer, auth_result.message))
 
-        account_internal = InternalAccount(account, vo=vo)
-        dids_with_internal_scope = [{'name': d['name'], 'scope': InternalScope(d['scope'], vo=vo)} for d in dids]
-
-        return rule.add_rule(account=account_internal,
-                             dids=dids_with_internal_scope,
-                             copies=copies,
-                             rse_expression=rse_expression,
-                             grouping=grouping,
-                             weight=weight,
-                             lifetime=lifetime,
-                             locked=locked,
-                             subscription_id=subscription_id,
-                             source_replica_expression=source_replica_expression,
-                             activity=activity,
-                             notify=notify,
-                             purge_replicas=purge_replicas,
-                             ignore_availability=ignore_availability,
-                             comment=comment,
-                             ask_approval=ask_approval,
-                             asynchronous=asynchronous,
-                             delay_injection=delay_injection,
-                             priority=priority,
-                             split_container=split_container,
-                             meta=meta,
-                             session=session)
+        # The validated arguments are passed on to the core, with the internal representations of the account and scopes
+        kwargs['account'] = InternalAccount(account, vo=vo)
+        # The DIDs of a rule usually share a few scopes, build each InternalScope only once
+        internal_scopes: dict[str, InternalScope] = {}
+        dids_with_internal_scope = []
+        for d in dids:
+            internal_scope = internal_scopes.get(d['scope'])
+            if internal_scope is None:
+                internal_scope = internal_scopes[d['scope']] = InternalScope(d['scope'], vo=vo)
+            dids_with_internal_scope.append({'name': d['name'], 'scope': internal_scope})
+        kwargs['dids'] = dids_with_internal_scope
+
+        return rule.add_rule(**kwargs, session=session)
 
 
 def get_replication_rule(rule_id: str, issuer: str, vo: str = DEFAULT_VO) -> dict[str, Any]:
@@ -161,15 +194,17 @@ def get_replication_rule(rule_id: str, issuer: str, vo: str = DEFAULT_VO) -> dic
 def list_replication_rules(
     filters: Optional[dict[str, Any]] = None,
     vo: str = DEFAULT_VO,
+    columns: Optional["Sequence[str]"] = None,
 ) -> "Iterator[dict[str, Any]]":
     """
     Lists replication rules based on a filter.
 
     :param filters: dictionary of attributes by which the results should be filtered.
     :param vo: The VO to act on.
+    :param columns: names of the rule columns to return. All columns if not set.
     """
-    # If filters is empty, create a new dict to avoid overwriting the function's default
-    filters = filters or {}
+    # Work on a copy, so that the caller's filters are not converted to internal types
+    filters = dict(filters) if filters else {}
 
     if 'scope' in filters:
         scope = filters['scope']
@@ -184,7 +219,7 @@ def list_replication_rules(
     filters['account'] = InternalAccount(account=account, vo=vo)
 
     with db_session(DatabaseOperationType.READ) as session:
-        rules = rule.list_rules(filters, session=session)
+        rules = rule.list_rules(filters, columns=columns, session=session)
         for r in rules:
             yield gateway_update_return_dict(r, session=session)
 
@@ -265,13 +300,7 @@ def delete_replication_rule(
     """
     kwargs = {'rule_id': rule_id, 'purge_replicas': purge_replicas}
     with db_session(DatabaseOperationType.WRITE) as session:
-        if is_multi_vo(session=session):
-            auth_result = has_permission(issuer=issuer, vo=vo, action='access_rule_vo', kwargs=kwargs, session=session)
-            if not auth_result.allowed:
-                raise AccessDenied('Account %s can not access rules at other VOs. %s' % (issuer, auth_result.message))
-        auth_result = has_permission(issuer=issuer, vo=vo, action='del_rule', kwargs=kwargs)
-        if not auth_result.allowed:
-            raise AccessDenied('Account %s can not remove this replication rule. %s' % (issuer, auth_result.message))
+        _check_rule_permissions(issuer, vo, 'del_rule', kwargs, 'remove this replication rule', session=session)
         rule.delete_rule(rule_id=rule_id, purge_replicas=purge_replicas, soft=True, session=session)
 
 
@@ -292,14 +321,8 @@ def update_replication_rule(
     """
     kwargs = {'rule_id': rule_id, 'options': options}
     with db_session(DatabaseOperationType.WRITE) as session:
-        if is_multi_vo(session=session):
-            auth_result = has_permission(issuer=issuer, vo=vo, action='access_rule_vo', kwargs=kwargs, session=session)
-            if not auth_result.allowed:
-                raise AccessDenied('Account %s can not access rules at other VOs. %s' % (issuer, auth_result.message))
         if 'approve' in options:
-            auth_result = has_permission(issuer=issuer, vo=vo, action='approve_rule', kwargs=kwargs, session=session)
-            if not auth_result.allowed:
-                raise AccessDenied('Account %s can not approve/deny this replication rule. %s' % (issuer, auth_result.message))
+            _check_rule_permissions(issuer, vo, 'approve_rule', kwargs, 'approve/deny this replication rule', session=session)
 
             issuer_ia = InternalAccount(issuer, vo=vo)
             if options['approve']:
@@ -307,9 +330,7 @@ def update_replication_rule(
             else:
                 rule.deny_rule(rule_id=rule_id, approver=issuer_ia, reason=options.get('comment', None), session=session)
         else:
-            auth_result = has_permission(issuer=issuer, vo=vo, action='update_rule', kwargs=kwargs, session=session)
-            if not auth_result.allowed:
-                raise AccessDenied('Account %s can not update this replication rule. %s' % (issuer, auth_result.message))
+            _check_rule_permissions(issuer, vo, 'update_rule', kwargs, 'update this replication rule', session=session)
             if 'account' in options:
                 options['account'] = InternalAccount(options['account'], vo=vo)
             rule.update_rule(rule_id=rule_id, options=options, session=session)
@@ -334,13 +355,7 @@ def reduce_replication_rule(
     """
     kwargs = {'rule_id': rule_id, 'copies': copies, 'exclude_expression': exclude_expression}
     with db_session(DatabaseOperationType.WRITE) as session:
-        if is_multi_vo(session=session):
-            auth_result = has_permission(issuer=issuer, vo=vo, action='access_rule_vo', kwargs=kwargs, session=session)
-            if not auth_result.allowed:
-                raise AccessDenied('Account %s can not access rules at other VOs. %s' % (issuer, auth_result.message))
-        auth_result = has_permission(issuer=issuer, vo=vo, action='reduce_rule', kwargs=kwargs, session=session)
-        if not auth_result.allowed:
-            raise AccessDenied('Account %s can not reduce this replication rule. %s' % (issuer, auth_result.message))
+        _check_rule_permissions(issuer, vo, 'reduce_rule', kwargs, 'reduce this replication rule', session=session)
 
         return rule.reduce_rule(rule_id=rule_id, copies=copies, exclude_expression=exclude_expression, session=session)
 
@@ -366,7 +381,10 @@ def examine_replication_rule(
         result = rule.examine_rule(rule_id, session=session)
         result = gateway_update_return_dict(result, session=session)
         if 'transfers' in result:
-            result['transfers'] = [gateway_update_return_dict(t, session=session) for t in result['transfers']]
+            # Convert in place: the transfers must be resolved while the session is open
+            transfers = result['transfers']
+            for i, transfer in enumerate(transfers):
+                transfers[i] = gateway_update_return_dict(transfer, session=session)
     return result
 
 
@@ -386,9 +404,8 @@ def move_replication_rule(
     :param vo:                         The VO to act on.
     :raises:                           RuleNotFound, RuleReplaceFailed, InvalidRSEExpression, AccessDenied
     """
-    override = override.copy()
     if 'account' in override:
-        override['account'] = InternalAccount(override['account'], vo=vo)
+        override = {**override, 'account': InternalAccount(override['account'], vo=vo)}
     kwargs = {
         'rule_id': rule_id,
         'rse_expression': rse_expression,
@@ -396,12 +413,6 @@ def move_replication_rule(
     }
 
     with db_session(DatabaseOperationType.WRITE) as session:
-        if is_multi_vo(session=session):
-            auth_result = has_permission(issuer=issuer, vo=vo, action='access_rule_vo', kwargs=kwargs, session=session)
-            if not auth_result.allowed:
-                raise AccessDenied('Account %s can not access rules at other VOs. %s' % (issuer, auth_result.message))
-        auth_result = has_permission(issuer=issuer, vo=vo, action='move_rule', kwargs=kwargs, session=session)
-        if not auth_result.allowed:
-            raise AccessDenied('Account %s can not move this replication rule. %s' % (issuer, auth_result.message))
+        _check_rule_permissions(issuer, vo, 'move_rule', kwargs, 'move this replication rule', session=session)
 
         return rule.move_rule(**kwargs, session=session)
@@ -18,7 +18,7 @@ import logging
 import os
 import re
 from configparser import NoOptionError, NoSectionError
-from functools import wraps
+from functools import lru_cache, wraps
 from time import time
 from typing import TYPE_CHECKING, Any, Literal, Optional, TypeVar, Union, cast
 from urllib.parse import unquote_plus
@@ -26,15 +26,16 @@ from urllib.parse import unquote_plus
 import flask
 from flask.views import MethodView
 from typing_extensions import ParamSpec
-from werkzeug.datastructures import Headers
+from werkzeug.datastructures import Headers, MIMEAccept
 from werkzeug.exceptions import HTTPException
+from werkzeug.http import parse_accept_header
 from werkzeug.wrappers import Request, Response
 
 from rucio.common import config
 from rucio.common.constants import DEFAULT_VO
 from rucio.common.exception import CannotAuthenticate, DatabaseException, IdentityError, RucioException, UnsupportedRequestedContentType
 from rucio.common.schema import get_schema_value
-from rucio.common.utils import generate_uuid, render_json
+from rucio.common.utils import generate_uuid
 from rucio.core.vo import map_vo
 from rucio.gateway.authentication import validate_auth_token
 from rucio.gateway.identity import get_default_account, list_accounts_for_identity, verify_identity
@@ -193,6 +194,18 @@ def check_accept_header_wrapper_flask(
 ) -> 'Callable[[Callable[P, R]], Callable[P, R]]':
     """Decorator that refuses requests with an unsupported *Accept* header."""
 
+    # materialised once, so that the supported types can be checked on every request
+    supported = tuple(supported_content_types)
+
+    @lru_cache(maxsize=128)
+    def is_acceptable(accept_header: Optional[str]) -> bool:
+        """Negotiate a raw *Accept* header, cached as clients keep sending the same ones."""
+        accept_mimetypes = parse_accept_header(accept_header, MIMEAccept)
+
+        # 1. no Accept header → accept everything
+        # 2. at least one acceptable media‑type → call the view
+        return not accept_mimetypes.provided or any(s in accept_mimetypes for s in supported)
+
     def wrapper(
             f: 'Callable[P, R]'
     ) -> 'Callable[P, R]':
@@ -202,12 +215,7 @@ def check_accept_header_wrapper_flask(
         def decorated(*args: 'P.args', **kwargs: 'P.kwargs') -> 'R':
             """Run the header check, then delegate to *f* (or return 406)."""
 
-            # 1. no Accept header → accept everything
-            if not flask.request.accept_mimetypes.provided:
-                return f(*args, **kwargs)
-
-            # 2. at least one acceptable media‑type → call the view
-            if any(s in flask.request.accept_mimetypes for s in supported_content_types):
+            if is_acceptable(flask.request.headers.get('Accept')):
                 return f(*args, **kwargs)
 
             # 3. none matched → 406 response
@@ -219,7 +227,7 @@ def check_accept_header_wrapper_flask(
                     exc_msg=(
                         f'The requested content type '
                         f'{flask.request.environ.get("HTTP_ACCEPT")} is not supported. '
-                        f'Use {supported_content_types}.'
+                        f'Use {list(supported)}.'
                     ),
                 ),
             )
@@ -269,7 +277,8 @@ def parse_scope_name(scope_name: str, vo: Optional[str]) -> tuple[str, ...]:
 
 def try_stream(
         generator: 'SupportsIter',
-        content_type: Optional[str] = None
+        content_type: Optional[str] = None,
+        direct_passthrough: bool = False
 ) -> flask.Response:
     """
     Peeks at the first element of the passed generator and raises
@@ -279,6 +288,8 @@ def try_stream(
     :param generator: a generator function or an iterator.
     :param content_type: the response's Content-Type.
                          'application/x-json-stream' by default.
+    :param direct_passthrough: pass the generated chunks as-is to the WSGI server,
+                               only valid if the generator yields bytes.
     :returns: a response object with the specified Content-Type.
     """
     if not content_type:
@@ -287,7 +298,7 @@ def try_stream(
     it = iter(generator)
     try:
         peek = next(it)
-        return flask.Response(flask.stream_with_context(itertools.chain((peek,), it)), content_type=content_type)
+        return flask.Response(flask.stream_with_context(itertools.chain((peek,), it)), content_type=content_type, direct_passthrough=direct_passthrough)
     except StopIteration:
         return flask.Response('', content_type=content_type)
 
@@ -317,6 +328,12 @@ def _error_response(exc_cls: str, exc_msg: str) -> tuple[dict[str, str], dict[st
     return data, headers
 
 
+@lru_cache(maxsize=256)
+def _error_body_prefix(exc_cls: str) -> str:
+    """Return the JSON error body of an exception class up to its message, as rendered by render_json."""
+    return '{"ExceptionClass": %s, "ExceptionMessage": ' % json.dumps(exc_cls)
+
+
 def generate_http_error_flask(
         status_code: int,
         exc: Union[str, BaseException],
@@ -347,7 +364,8 @@ def generate_http_error_flask(
             status=status_code,
             headers=headers,
             content_type=prioheaders['Content-Type'],
-            response=render_json(**data),
+            # same output as render_json(**data), with the part depending only on the class encoded once
+            response=_error_body_prefix(exc_cls) + json.dumps(exc_msg) + '}',
         )
     except Exception:
         logging.exception(f'Cannot create generate_http_error_flask response with {data}')
@@ -12,20 +12,105 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from json import dumps
+from functools import partial
+from itertools import chain
+from json import dumps, loads
+from typing import TYPE_CHECKING, Any
 
-from flask import Flask, Response, request
+from flask import Flask, Response, request, stream_with_context
 
 from rucio.common.exception import AccessDenied, InvalidObject, LifetimeExceptionDuplicate, LifetimeExceptionNotFound, UnsupportedOperation
-from rucio.common.utils import APIEncoder
+from rucio.common.extra import import_extras
+from rucio.common.utils import APIEncoder, api_encoder_default
 from rucio.gateway.lifetime_exception import add_exception, list_exceptions, update_exception
 from rucio.web.rest.flaskapi.authenticated_bp import AuthenticatedBlueprint
 from rucio.web.rest.flaskapi.v1.common import ErrorHandlingMethodView, check_accept_header_wrapper_flask, generate_http_error_flask, json_parameters, param_get, response_headers, try_stream
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+EXTRA_MODULES = import_extras(['orjson'])
+
+# Enum fields of the lifetime exception rows, which the API serializes by name
+_ENUM_FIELDS = ('did_type', 'state')
+
+# Shared encoder, to not build a new one for each serialized row
+_encode = APIEncoder().encode
+
+
+def _api_encoder_dumps_line(exception: dict[str, Any]) -> bytes:
+    """ Serialize a lifetime exception to a line of newline-delimited JSON with the APIEncoder. """
+    return (_encode(exception) + '\n').encode()
+
+
+def _api_encoder_dumps(obj: Any) -> bytes:
+    """ Serialize a response body with the json module. """
+    return dumps(obj).encode()
+
+
+_dumps_line = _api_encoder_dumps_line
+_dumps = _api_encoder_dumps
+_loads = loads
+
+if EXTRA_MODULES['orjson']:
+    import orjson  # pylint: disable=import-error
+
+    # orjson serializes datetimes to ISO 8601, pass them to the default hook to keep the RFC 1123 format
+    _orjson_dumps_line = partial(orjson.dumps, default=api_encoder_default, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_PASSTHROUGH_DATETIME)
+
+    def _orjson_dumps_line_by_name(exception: dict[str, Any]) -> bytes:
+        """ Serialize a lifetime exception to a line of newline-delimited JSON with orjson. """
+        # orjson serializes enums by value, the API uses their names.
+        # The gateway yields a new dictionary per exception, so it can be updated in place.
+        for key in _ENUM_FIELDS:
+            value = exception[key]
+            if value is not None:
+                exception[key] = value.name
+        return _orjson_dumps_line(exception)
+
+    _dumps_line = _orjson_dumps_line_by_name
+    _dumps = orjson.dumps
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so json_parameters reports invalid bodies the same way
+    _loads = orjson.loads
+
+
+_STREAM_CONTENT_TYPE = 'application/x-json-stream'
+
+# Streamed lines are sent in chunks of at most _STREAM_BATCH_ROWS rows or about _STREAM_BATCH_BYTES bytes
+_STREAM_BATCH_ROWS = 64
+_STREAM_BATCH_BYTES = 16384
+
+
+def _batch_lines(lines: 'Iterable[bytes]') -> 'Iterator[bytes]':
+    """ Group serialized lines into larger chunks, to limit the number of writes to the client. """
+    # the buffer is reused for all the chunks of the stream, it is local so that concurrent streams do not share it
+    buf = bytearray()
+    rows = 0
+    for line in lines:
+        buf += line
+        rows += 1
+        if rows >= _STREAM_BATCH_ROWS or len(buf) >= _STREAM_BATCH_BYTES:
+            yield bytes(buf)
+            buf.clear()
+            rows = 0
+    if buf:
+        yield bytes(buf)
+
+
+def _stream_exceptions(exceptions: 'Iterable[dict[str, Any]]') -> 'Iterator[bytes]':
+    """
+    Stream lifetime exceptions as newline-delimited JSON.
+    The chunks are already encoded, so that the responses can pass them through to the WSGI server.
+    """
+    yield from _batch_lines(map(_dumps_line, exceptions))
+
 
 class LifetimeException(ErrorHandlingMethodView):
     """ REST APIs for Lifetime Model exception. """
 
+    # the view keeps no per-request state, a single instance serves all the requests
+    init_every_request = False
+
     @check_accept_header_wrapper_flask(['application/x-json-stream'])
     def get(self):
         """
@@ -85,14 +170,7 @@ class LifetimeException(ErrorHandlingMethodView):
           406:
             description: "Not acceptable"
         """
-        try:
-            def generate(vo):
-                for exception in list_exceptions(vo=vo):
-                    yield dumps(exception, cls=APIEncoder) + '\n'
-
-            return try_stream(generate(vo=request.environ['vo']))
-        except LifetimeExceptionNotFound as error:
-            return generate_http_error_flask(404, error)
+        return try_stream(_stream_exceptions(list_exceptions(vo=request.environ['vo'])), content_type=_STREAM_CONTENT_TYPE, direct_passthrough=True)
 
     def post(self):
         """
@@ -141,12 +219,13 @@ class LifetimeException(ErrorHandlingMethodView):
           409:
             description: "Lifetime exception already exists."
         """
-        parameters = json_parameters()
+        environ = request.environ
+        parameters = json_parameters(json_loads=_loads)
         try:
             exception_id = add_exception(
                 dids=param_get(parameters, 'dids', default=[]),
-                account=request.environ['issuer'],
-                vo=request.environ['vo'],
+                account=environ['issuer'],
+                vo=environ['vo'],
                 pattern=param_get(parameters, 'pattern', default=None),
                 comments=param_get(parameters, 'comments', default=None),
                 expires_at=param_get(parameters, 'expires_at', default=None),
@@ -158,12 +237,15 @@ class LifetimeException(ErrorHandlingMethodView):
         except LifetimeExceptionDuplicate as error:
             return generate_http_error_flask(409, error)
 
-        return Response(dumps(exception_id), status=201, content_type="application/json")
+        return Response(_dumps(exception_id), status=201, content_type="application/json")
 
 
 class LifetimeExceptionId(ErrorHandlingMethodView):
     """ REST APIs for Lifetime Model exception. """
 
+    # the view keeps no per-request state, a single instance serves all the requests
+    init_every_request = False
+
     @check_accept_header_wrapper_flask(['application/x-json-stream'])
     def get(self, exception_id):
         """
@@ -230,14 +312,13 @@ class LifetimeExceptionId(ErrorHandlingMethodView):
           406:
             description: "Not acceptable"
         """
-        try:
-            def generate(vo):
-                for exception in list_exceptions(exception_id, vo=vo):
-                    yield dumps(exception, cls=APIEncoder) + '\n'
-
-            return try_stream(generate(vo=request.environ['vo']))
-        except LifetimeExceptionNotFound as error:
-            return generate_http_error_flask(404, error)
+        # listing an exception does not raise if it does not exist, probe the first row to return the 404
+        exceptions = iter(list_exceptions(exception_id, vo=request.environ['vo']))
+        first = next(exceptions, None)
+        if first is None:
+            return generate_http_error_flask(404, LifetimeExceptionNotFound.__name__, f'Lifetime exception {exception_id} not found')
+        # the first row is already fetched, no need for try_stream to peek at the stream again
+        return Response(stream_with_context(_stream_exceptions(chain((first,), exceptions))), content_type=_STREAM_CONTENT_TYPE, direct_passthrough=True)
 
     def put(self, exception_id):
         """
@@ -278,11 +359,12 @@ class LifetimeExceptionId(ErrorHandlingMethodView):
           400:
             description: "Cannot decode json parameter list."
         """
-        parameters = json_parameters()
+        environ = request.environ
+        parameters = json_parameters(json_loads=_loads)
         state = param_get(parameters, 'state', default=None)
 
         try:
-            update_exception(exception_id=exception_id, state=state, issuer=request.environ['issuer'], vo=request.environ['vo'])
+            update_exception(exception_id=exception_id, state=state, issuer=environ['issuer'], vo=environ['vo'])
         except UnsupportedOperation as error:
             return generate_http_error_flask(400, error)
         except AccessDenied as error:
@@ -299,7 +381,8 @@ def blueprint() -> AuthenticatedBlueprint:
     lifetime_exception_view = LifetimeException.as_view('lifetime_exception')
     bp.add_url_rule('/', view_func=lifetime_exception_view, methods=['get', 'post'])
     lifetime_exception_id_view = LifetimeExceptionId.as_view('lifetime_exception_id')
-    bp.add_url_rule('/<exception_id>', view_func=lifetime_exception_id_view, methods=['get', 'put'])
+    # ids are UUIDs, either as 32 hex digits or in the 36 characters hyphenated form
+    bp.add_url_rule('/<string(minlength=32, maxlength=36):exception_id>', view_func=lifetime_exception_id_view, methods=['get', 'put'])
 
     bp.after_request(response_headers)
     return bp
@@ -108,6 +108,7 @@ server_requirements_table = {
             'globus-sdk<=3.41.0',
         ],
         'saml': ['python3-saml<=1.16.0'],
+        'orjson': ['orjson<=3.10.15'],
         'dev': dev_requirements
     }
 }
@@ -41,6 +41,7 @@ if TYPE_CHECKING:
     from rucio.client.replicaclient import ReplicaClient
     from rucio.client.rseclient import RSEClient
     from rucio.client.scopeclient import ScopeClient
+    from rucio.common.config import Config
     from rucio.common.types import InternalAccount, InternalScope
 
     from .temp_factories import TemporaryDidFactory, TemporaryFileFactory, TemporaryRSEFactory
@@ -655,7 +656,7 @@ def temp_config_file() -> "Iterator[ConfigParser]":
 
 
 @pytest.fixture
-def file_config_mock(request: pytest.FixtureRequest) -> "Iterator[ConfigParser]":
+def file_config_mock(request: pytest.FixtureRequest) -> "Iterator[Config]":
     """
     Fixture which allows to have an isolated in-memory configuration file instance which
     is not persisted after exiting the fixture.
@@ -675,8 +676,8 @@ def file_config_mock(request: pytest.FixtureRequest) -> "Iterator[ConfigParser]"
         overrides = params.get("overrides", overrides)
         removes = params.get("removes", removes)
 
-    parser = Config().parser
-    with mock.patch('rucio.common.config.get_config', side_effect=lambda: parser):
+    config = Config()
+    with mock.patch('rucio.common.config.get_config', side_effect=lambda: config):
         for section, option, value in (overrides or []):
             if not config_has_section(section):
                 config_add_section(section)
@@ -684,7 +685,7 @@ def file_config_mock(request: pytest.FixtureRequest) -> "Iterator[ConfigParser]"
         for section, option in (removes or []):
             if config_has_section(section) and config_has_option(section, option):
                 config_remove_option(section, option)
-        yield parser
+        yield config
 
 
 @pytest.fixture
@@ -11,11 +11,13 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import configparser
 import os
+from unittest import mock
 
 import pytest
 
-from rucio.common.config import _convert_to_boolean, clean_cached_config, convert_to_any_type, get_config, get_config_dirs
+from rucio.common.config import Config, _convert_to_boolean, clean_cached_config, config_get, config_get_items, config_get_many, config_get_options, config_set, convert_to_any_type, get_config, get_config_dirs, is_client
 
 
 class TestConversion:
@@ -83,6 +85,68 @@ class TestConfig:
 
         assert config_call_1 is not config_call_2
 
+    def test_get_config_reloaded_on_change(self, tmp_path):
+        config_file = tmp_path / 'rucio.cfg'
+        config_file.write_text('[common]\nvalue = 1\n')
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setenv('RUCIO_CONFIG', str(config_file))
+            mp.setattr('rucio.common.config.CONFIG_MTIME_CHECK_INTERVAL', 0)
+            clean_cached_config()
+            config_call_1 = get_config()
+            assert config_call_1.get('common', 'value') == '1'
+            assert get_config() is config_call_1
+
+            config_file.write_text('[common]\nvalue = 2\n')
+            mtime = os.stat(config_file).st_mtime_ns + 10 ** 9
+            os.utime(config_file, ns=(mtime, mtime))
+            config_call_2 = get_config()
+            assert config_call_2 is not config_call_1
+            assert config_call_2.get('common', 'value') == '2'
+        clean_cached_config()
+
+    def test_get_missing_option(self, tmp_path):
+        config_file = tmp_path / 'rucio.cfg'
+        config_file.write_text('[DEFAULT]\ndefault = 1\n[common]\nbase = 2\n')
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setenv('RUCIO_CONFIG', str(config_file))
+            config = Config()
+        # the misses are answered from the snapshot, without going through the parser
+        with mock.patch.object(config, 'parser', wraps=config.parser) as parser_mock:
+            with pytest.raises(configparser.NoOptionError):
+                config.get('common', 'missing')
+            with pytest.raises(configparser.NoSectionError):
+                config.get('missing', 'base')
+            assert not config.has_option('common', 'missing')
+            assert not config.has_option('missing', 'base')
+            assert config.get('DEFAULT', 'default') == '1'
+            assert parser_mock.method_calls == []
+
+    def test_options_order_with_defaults(self, tmp_path):
+        config_file = tmp_path / 'rucio.cfg'
+        config_file.write_text('[DEFAULT]\ndefault = 1\n[common]\nbase = 2\n')
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setenv('RUCIO_CONFIG', str(config_file))
+            clean_cached_config()
+            # same orders as ConfigParser: the section options first, but the DEFAULT items first
+            assert config_get_options('common') == ['base', 'default']
+            assert config_get_items('common') == [('default', '1'), ('base', '2')]
+        clean_cached_config()
+
+    @pytest.mark.parametrize("value, expected", [
+        ("1", True),
+        ("True", True),
+        ("client", True),
+        ("0", False),
+        ("false", False),
+        ("", False),
+    ])
+    def test_is_client_from_environment(self, value, expected):
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setenv('RUCIO_CLIENT_MODE', value)
+            is_client.cache_clear()
+            assert is_client() is expected
+        is_client.cache_clear()
+
     def test_get_config_dirs(self):
         rucio_home = "test"
         virtual_env = "test2"
@@ -91,6 +155,7 @@ class TestConfig:
             mp.setenv('RUCIO_HOME', rucio_home)
             mp.setenv('VIRTUAL_ENV', virtual_env)
             mp.setenv('CONDA_PREFIX', conda_prefix)
+            get_config_dirs.cache_clear()
 
             expected_dirs = [
                 os.path.join(rucio_home, 'etc', ''),
@@ -99,3 +164,26 @@ class TestConfig:
                 '/opt/rucio/etc/'
             ]
             assert get_config_dirs() == expected_dirs
+        get_config_dirs.cache_clear()
+
+    @pytest.mark.parametrize("file_config_mock", [{"overrides": [('test_section', 'test_option', '1')]}], indirect=True)
+    def test_converted_value_invalidated_on_set(self, file_config_mock):
+        assert config_get('test_section', 'test_option', check_config_table=False) == '1'
+        config_set('test_section', 'test_option', '2')
+        assert config_get('test_section', 'test_option', check_config_table=False) == '2'
+
+    @pytest.mark.parametrize("file_config_mock", [{"overrides": [('test_section', 'test_option', '1')]}], indirect=True)
+    def test_converted_value_bound_to_config(self, file_config_mock):
+        assert config_get('test_section', 'test_option', check_config_table=False) == '1'
+        other_config = Config()
+        if not other_config.has_section('test_section'):
+            other_config.add_section('test_section')
+        other_config.set('test_section', 'test_option', '2')
+        with mock.patch('rucio.common.config.get_config', side_effect=lambda: other_config):
+            assert config_get('test_section', 'test_option', check_config_table=False) == '2'
+
+    @pytest.mark.parametrize("file_config_mock", [{"overrides": [('test_section', 'option_a', 'a'), ('test_section', 'option_b', 'b')]}], indirect=True)
+    def test_config_get_many(self, file_config_mock):
+        values = config_get_many('test_section', ['option_a', 'option_b', 'option_c'], defaults={'option_b': 'x', 'option_c': 'c'})
+        assert values == {'option_a': 'a', 'option_b': 'b', 'option_c': 'c'}
+        assert config_get_many('missing_section', ['option_a']) == {'option_a': None}
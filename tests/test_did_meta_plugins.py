@@ -17,7 +17,7 @@ from copy import deepcopy
 import pytest
 
 from rucio.client.didclient import DIDClient
-from rucio.common.exception import KeyNotFound
+from rucio.common.exception import DataIdentifierNotFound, KeyNotFound
 from rucio.common.utils import generate_uuid
 from rucio.core.did import add_did, delete_dids, get_metadata_bulk, set_dids_metadata_bulk, set_metadata_bulk
 from rucio.core.did_meta_plugins import get_metadata, list_dids, set_metadata
@@ -248,6 +248,12 @@ class TestDidMetaMongo:
         mongo_meta.set_metadata(scope=mock_scope, name=did_name, key=meta_key, value=meta_value)
         assert mongo_meta.get_metadata(scope=mock_scope, name=did_name)[meta_key] == meta_value
 
+    def test_get_metadata_unknown_did(self, mock_scope, mongo_meta):
+        """ DID Meta (MONGO): Get the meta of an unknown DID """
+
+        with pytest.raises(DataIdentifierNotFound):
+            mongo_meta.get_metadata(scope=mock_scope, name=did_name_generator('dataset'))
+
     @pytest.mark.dirty
     def test_list_did_meta(self, mock_scope, root_account, mongo_meta):
         """ DID Meta (MONGO): List DID meta """
@@ -306,6 +312,70 @@ class TestDidMetaMongo:
         # assert [{'scope': (tmp_scope), 'name': tmp_dsn4}] == results
         assert [tmp_dsn4] == results
 
+    @pytest.mark.dirty
+    def test_get_metadata_bulk(self, mock_scope, root_account, mongo_meta):
+        """ DID Meta (MONGO): Get the meta of several DIDs """
+
+        meta_key = 'my_key_%s' % generate_uuid()
+        did_names = [did_name_generator('dataset') for _ in range(2)]
+        for i, did_name in enumerate(did_names):
+            add_did(scope=mock_scope, name=did_name, did_type='DATASET', account=root_account)
+            mongo_meta.set_metadata(scope=mock_scope, name=did_name, key=meta_key, value='my_value_%d' % i)
+        unknown_name = did_name_generator('dataset')
+
+        metadata = mongo_meta.get_metadata_bulk([{'scope': mock_scope, 'name': name} for name in did_names + [unknown_name]])
+        assert set(metadata) == {(mock_scope, name) for name in did_names}
+        for i, did_name in enumerate(did_names):
+            assert metadata[(mock_scope, did_name)][meta_key] == 'my_value_%d' % i
+            assert '_id' not in metadata[(mock_scope, did_name)]
+
+        assert mongo_meta.get_metadata_bulk([]) == {}
+
+    @pytest.mark.dirty
+    def test_set_metadata_many(self, mock_scope, root_account, mongo_meta):
+        """ DID Meta (MONGO): Set the meta of several DIDs at once """
+
+        meta_key1 = 'my_key_%s' % generate_uuid()
+        meta_key2 = 'my_key_%s' % generate_uuid()
+        did_names = [did_name_generator('dataset') for _ in range(2)]
+        for did_name in did_names:
+            add_did(scope=mock_scope, name=did_name, did_type='DATASET', account=root_account)
+
+        mongo_meta.set_metadata_many([
+            (mock_scope, did_names[0], {meta_key1: 'my_value_1', meta_key2: 'my_value_2'}),
+            (mock_scope, did_names[1], {meta_key1: 'my_value_3'}),
+        ])
+        metadata = mongo_meta.get_metadata_bulk([{'scope': mock_scope, 'name': name} for name in did_names])
+        assert metadata[(mock_scope, did_names[0])][meta_key1] == 'my_value_1'
+        assert metadata[(mock_scope, did_names[0])][meta_key2] == 'my_value_2'
+        assert metadata[(mock_scope, did_names[1])][meta_key1] == 'my_value_3'
+        assert meta_key2 not in metadata[(mock_scope, did_names[1])]
+
+        # an empty input is a no-op
+        mongo_meta.set_metadata_many([])
+        assert mongo_meta.get_metadata_bulk([{'scope': mock_scope, 'name': name} for name in did_names]) == metadata
+
+    @pytest.mark.dirty
+    def test_delete_metadata_bulk(self, mock_scope, root_account, mongo_meta):
+        """ DID Meta (MONGO): Delete several meta keys of a DID at once """
+
+        meta_keys = ['my_key_%s' % generate_uuid() for _ in range(3)]
+        did_name = did_name_generator('dataset')
+        add_did(scope=mock_scope, name=did_name, did_type='DATASET', account=root_account)
+        mongo_meta.set_metadata_many([(mock_scope, did_name, {key: 'my_value' for key in meta_keys})])
+        did = {'scope': mock_scope, 'name': did_name}
+        assert all(key in mongo_meta.get_metadata_bulk([did])[(mock_scope, did_name)] for key in meta_keys)
+
+        mongo_meta.delete_metadata_bulk(scope=mock_scope, name=did_name, keys=meta_keys[:2])
+        metadata = mongo_meta.get_metadata_bulk([did])[(mock_scope, did_name)]
+        assert meta_keys[0] not in metadata
+        assert meta_keys[1] not in metadata
+        assert metadata[meta_keys[2]] == 'my_value'
+
+        # an empty list of keys is a no-op
+        mongo_meta.delete_metadata_bulk(scope=mock_scope, name=did_name, keys=[])
+        assert mongo_meta.get_metadata_bulk([did])[(mock_scope, did_name)] == metadata
+
 
 @pytest.fixture
 def elastic_meta():
@@ -21,14 +21,17 @@ import pytest
 
 from rucio.common.exception import ConfigNotFound, UnsupportedOperation
 from rucio.common.policy import REGION
+from rucio.common.utils import DATE_FORMAT
 from rucio.common.utils import generate_uuid as uuid
 from rucio.core import config as core_config
 from rucio.core.did import get_metadata, set_metadata
 from rucio.core.lifetime_exception import add_exception
 from rucio.core.rule import add_rule, get_rule
 from rucio.daemons.atropos.atropos import atropos
-from rucio.db.sqla.constants import DIDType
-from rucio.tests.common import skip_multivo
+from rucio.db.sqla import models
+from rucio.db.sqla.constants import DatabaseOperationType, DIDType, LifetimeExceptionsState
+from rucio.db.sqla.session import db_session
+from rucio.tests.common import auth, headers, skip_multivo
 
 
 @pytest.mark.noparallel(reason='Race conditions with the other tests in test_lifetime.py, they all modify and use the config.')
@@ -270,3 +273,31 @@ def test_atropos(root_account, rse_factory, mock_scope, did_factory, rucio_clien
 
     # Clean-up
     os.remove('/opt/rucio/etc/policies/config_other.json')
+
+
+def test_get_unknown_lifetime_exception(rest_client, auth_token):
+    """ LIFETIME (REST): Getting an unknown lifetime exception returns a 404 """
+    response = rest_client.get('/lifetime_exceptions/' + uuid(), headers=headers(auth(auth_token)))
+    assert response.status_code == 404
+    assert response.headers.get('ExceptionClass') == 'LifetimeExceptionNotFound'
+
+
+def test_get_lifetime_exception_stream(rest_client, auth_token, root_account, did_factory):
+    """ LIFETIME (REST): A streamed lifetime exception has RFC 1123 dates and enums serialized by name """
+    dataset = did_factory.make_dataset()
+    exception_id = uuid()
+    with db_session(DatabaseOperationType.WRITE) as session:
+        models.LifetimeException(id=exception_id, scope=dataset['scope'], name=dataset['name'], did_type=DIDType.DATASET, account=root_account,
+                                 comments='This is a comment', state=LifetimeExceptionsState.WAITING,
+                                 expires_at=datetime.utcnow() + timedelta(days=1)).save(session=session)
+
+    response = rest_client.get('/lifetime_exceptions/' + exception_id, headers=headers(auth(auth_token)))
+    assert response.status_code == 200
+    rows = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert len(rows) == 1
+    assert rows[0]['id'] == exception_id
+    assert rows[0]['did_type'] == 'DATASET'
+    assert rows[0]['state'] == 'WAITING'
+    # raises if the dates are not in the RFC 1123 format of the API
+    datetime.strptime(rows[0]['created_at'], DATE_FORMAT)
+    datetime.strptime(rows[0]['expires_at'], DATE_FORMAT)
@@ -16,7 +16,7 @@ from rucio.common.config import config_get
 from rucio.common.types import InternalScope
 from rucio.core.account import add_account_attribute
 from rucio.core.scope import add_scope
-from rucio.gateway.permission import has_permission
+from rucio.gateway.permission import has_permission, has_permissions
 from rucio.tests.common import scope_name_generator, skip_non_belleii
 
 
@@ -74,3 +74,13 @@ class TestPermissionCoreGateway:
         kwargs = {'options': {'boost_rule': True}}
         assert has_permission(issuer='root', action='update_rule', kwargs=kwargs, vo=vo)
         assert not has_permission(issuer='jdoe', action='update_rule', kwargs=kwargs, vo=vo)
+
+    def test_permissions_stop_at_denied_action(self, vo):
+        """ PERMISSION(CORE): Check several permissions at once, stopping at the first denied action """
+        kwargs = {'options': {'boost_rule': True}}
+        results = has_permissions(issuer='root', actions=['update_rule', 'add_account'], kwargs={**kwargs, 'account': 'account1'}, vo=vo)
+        assert list(results) == ['update_rule', 'add_account']
+        assert all(result.allowed for result in results.values())
+        results = has_permissions(issuer='jdoe', actions=['update_rule', 'add_account'], kwargs=kwargs, vo=vo)
+        assert list(results) == ['update_rule']
+        assert not results['update_rule'].allowed
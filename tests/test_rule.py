@@ -19,9 +19,10 @@ import string
 from collections import namedtuple
 from logging import getLogger
 from typing import TYPE_CHECKING
+from unittest import mock
 
 import pytest
-from sqlalchemy import func, select
+from sqlalchemy import event, func, select
 
 import rucio.gateway.rule
 from rucio.client.ruleclient import RuleClient
@@ -59,7 +60,7 @@ from rucio.daemons.abacus.rse import rse_update
 from rucio.daemons.judge.evaluator import re_evaluator
 from rucio.db.sqla import models
 from rucio.db.sqla.constants import OBSOLETE, DatabaseOperationType, DIDType, LockState, RuleState
-from rucio.db.sqla.session import db_session
+from rucio.db.sqla.session import db_session, get_engine
 from rucio.gateway.account import add_account
 from rucio.tests.common import account_name_generator, did_name_generator, rse_name_generator
 from rucio.tests.common_server import get_vo
@@ -1215,6 +1216,31 @@ class TestCore:
         assert (len(list(list_rules(filters={'scope': mock_scope, 'name': archive['name']}))) == 0)
         assert (len(list(list_rules(filters={'scope': mock_scope, 'name': files_in_archive[1]['name']}))) == 1)
 
+    def test_list_rules_columns(self, vo, did_factory, jdoe_account):
+        """ REPLICATION RULE (GATEWAY): List rules loading only some columns"""
+        dataset = did_factory.make_dataset()
+        rule_id = add_rule(dids=[dataset], account=jdoe_account, copies=1, rse_expression=self.rse1, grouping='NONE',
+                           weight=None, lifetime=None, locked=False, subscription_id=None)[0]
+
+        statements = []
+
+        def _record_statement(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = get_engine()
+        event.listen(engine, 'before_cursor_execute', _record_statement)
+        try:
+            rules = list(rucio.gateway.rule.list_replication_rules(filters={'scope': dataset['scope'].external, 'name': dataset['name']},
+                                                                   vo=vo, columns=['id', 'state']))
+        finally:
+            event.remove(engine, 'before_cursor_execute', _record_statement)
+
+        assert [r['id'] for r in rules] == [rule_id]
+        assert set(rules[0]) == {'id', 'state', 'bytes'}
+        assert isinstance(rules[0]['state'], RuleState)
+        # the rules are read by a single query, the columns not loaded are never lazy-loaded
+        assert len([statement for statement in statements if models.ReplicationRule.__tablename__ in statement.lower()]) == 1
+
     def test_add_rule_overlapping_dids(self, vo, mock_scope, jdoe_account):
         """ REPLICATION RULE (CORE): Test various overlap cases"""
 
@@ -1635,3 +1661,18 @@ def test_move_rule_invalid_argument(vo, rse_factory, did_factory, mock_scope, ro
 
     with pytest.raises(UnsupportedOperation):
         _ = move_rule(rule_id, new_rse, override={'xX_MyFirstStreetName_Xx': 17})
+
+
+def test_is_multi_vo_reset_with_config():
+    """ REPLICATION RULE (GATEWAY): The multi_vo setting is read again once the configuration is reloaded """
+    configs = [object()]
+    with mock.patch('rucio.gateway.rule._MULTI_VO', None), \
+            mock.patch('rucio.gateway.rule.get_config', side_effect=lambda: configs[-1]), \
+            mock.patch('rucio.gateway.rule.config_get_bool', side_effect=[False, True]) as config_get_bool_mock:
+        assert not rucio.gateway.rule.is_multi_vo(session=None)
+        assert not rucio.gateway.rule.is_multi_vo(session=None)
+        assert config_get_bool_mock.call_count == 1
+
+        configs.append(object())
+        assert rucio.gateway.rule.is_multi_vo(session=None)
+        assert config_get_bool_mock.call_count == 2